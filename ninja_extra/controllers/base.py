@@ -1,6 +1,6 @@
 import inspect
+import itertools
 import re
-import uuid
 from abc import ABC
 from typing import (
     TYPE_CHECKING,
@@ -25,6 +25,7 @@ from django.urls import URLPattern, path as django_path
 from injector import inject, is_decorated_with_inject
 from ninja import NinjaAPI, Router
 from ninja.constants import NOT_SET
+from ninja.renderers import BaseRenderer
 from ninja.security.base import AuthBase
 from ninja.signature import is_async
 from ninja.utils import normalize_path
@@ -54,10 +55,55 @@ class MissingAPIControllerDecoratorException(Exception):
     pass
 
 
+def get_route_function_bases(cls: Type) -> Tuple[Type, ...]:
+    """
+    Returns `cls` MRO in reverse order without the ControllerBase internals.
+    The result is stored on the class so subsequent calls are a single lookup.
+    """
+    bases = cls.__dict__.get("__api_controller_bases__")
+    if bases is None:
+        bases = tuple(
+            base_cls
+            for base_cls in reversed(cls.__mro__)
+            if base_cls not in _CONTROLLER_BASE_INTERNALS
+        )
+        type.__setattr__(cls, "__api_controller_bases__", bases)
+    return cast(Tuple[Type, ...], bases)
+
+
+def _route_functions_of(cls: Type) -> Tuple[RouteFunction, ...]:
+    route_functions = cls.__dict__.get("__route_functions_cache__")
+    if route_functions is None:
+        route_functions = tuple(
+            v for v in cls.__dict__.values() if isinstance(v, RouteFunction)
+        )
+        type.__setattr__(cls, "__route_functions_cache__", route_functions)
+    return cast(Tuple[RouteFunction, ...], route_functions)
+
+
 def get_route_functions(cls: Type) -> Iterable[RouteFunction]:
-    for method in cls.__dict__.values():
-        if isinstance(method, RouteFunction):
-            yield method
+    return _route_functions_of(cls)
+
+
+def _content_type_for(renderer: BaseRenderer) -> str:
+    """
+    Returns the response content type for `renderer`.
+    The formatted value is kept on the renderer and rebuilt when `media_type` or `charset` changes.
+    """
+    media_type, charset = renderer.media_type, renderer.charset
+    cached = getattr(renderer, "_ninja_extra_content_type", None)
+    if cached is not None and cached[0] == media_type and cached[1] == charset:
+        return cast(str, cached[2])
+
+    content_type = f"{media_type}; charset={charset}"
+    try:
+        setattr(
+            renderer, "_ninja_extra_content_type", (media_type, charset, content_type)
+        )
+    except AttributeError:  # pragma: no cover
+        # renderer does not accept new attributes e.g. defines `__slots__`
+        pass
+    return content_type
 
 
 def compute_api_route_function(
@@ -145,30 +191,35 @@ class ControllerBase(ABC):
             self.check_object_permissions(obj)
         return obj
 
-    def _get_permissions(self) -> Iterable[BasePermission]:
+    def _get_permissions(self) -> Tuple[BasePermission, ...]:
         """
         Instantiates and returns the list of permissions that this view requires.
+        Instances are created once per request context and reused afterwards.
         """
         if not self.context:
-            return
+            return ()
 
-        for permission_class in self.context.permission_classes:
-            permission_instance = permission_class()
-            yield permission_instance
+        permissions = self.context._permission_instances
+        if permissions is None:
+            permissions = tuple(
+                permission_class()
+                for permission_class in self.context.permission_classes
+            )
+            self.context._permission_instances = permissions
+        return permissions
 
     def check_permissions(self) -> None:
         """
         Check if the request should be permitted.
         Raises an appropriate exception if the request is not permitted.
         """
+        context = self.context
+        if not context or not context.request:
+            return
+
+        request = context.request
         for permission in self._get_permissions():
-            if (
-                self.context
-                and self.context.request
-                and not permission.has_permission(
-                    request=self.context.request, controller=self
-                )
-            ):
+            if not permission.has_permission(request=request, controller=self):
                 self.permission_denied(permission)
 
     def check_object_permissions(self, obj: Union[Any, Model]) -> None:
@@ -176,13 +227,14 @@ class ControllerBase(ABC):
         Check if the request should be permitted for a given object.
         Raises an appropriate exception if the request is not permitted.
         """
+        context = self.context
+        if not context or not context.request:
+            return
+
+        request = context.request
         for permission in self._get_permissions():
-            if (
-                self.context
-                and self.context.request
-                and not permission.has_object_permission(
-                    request=self.context.request, controller=self, obj=obj
-                )
+            if not permission.has_object_permission(
+                request=request, controller=self, obj=obj
             ):
                 self.permission_denied(permission)
 
@@ -190,17 +242,28 @@ class ControllerBase(ABC):
         self, message: Any, status_code: int = 200, **kwargs: Any
     ) -> HttpResponse:
         assert self.api and self.context and self.context.request
-        content = self.api.renderer.render(
+        renderer = self.api.renderer
+        content = renderer.render(
             self.context.request, message, response_status=status_code
         )
-        content_type = "{}; charset={}".format(
-            self.api.renderer.media_type, self.api.renderer.charset
-        )
+        content_type = _content_type_for(renderer)
         return HttpResponse(
             content, status=status_code, content_type=content_type, **kwargs
         )
 
 
+_CONTROLLER_BASE_INTERNALS = frozenset({ControllerBase, ABC, object})
+
+# shared by every APIController declared without `permissions`
+_DEFAULT_PERMISSIONS: Tuple[Type[BasePermission], ...] = (AllowAny,)
+
+# converts django-ninja `{param}` path syntax to django `<param>` in a single pass
+_PATH_PARAMETER_BRACES_TRANS = str.maketrans({"{": "<", "}": ">"})
+
+# `_op_id_counter` gives each controller route operation a process-unique id prefix
+_op_id_counter = itertools.count()
+
+
 class APIController:
     _PATH_PARAMETER_COMPONENT_RE = r"{(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)}"
 
@@ -236,6 +299,21 @@ class APIController:
     as shown with `AnotherController` example.
     """
 
+    __slots__ = (
+        "prefix",
+        "auth",
+        "tags",
+        "auto_import",
+        "permission_classes",
+        "registered",
+        "has_auth_async",
+        "_controller_class",
+        "_path_operations",
+        "_controller_class_route_functions",
+        "_prefix_has_route_param",
+        "_url_patterns_cache",
+    )
+
     # TODO: implement csrf on route function or on controller level. Which can override api csrf
     #   controller should have a csrf ON unless turned off by api instance
 
@@ -253,17 +331,22 @@ class APIController:
         # `auth` primarily defines APIController route function global authentication method.
         self.auth: Optional[AuthBase] = auth
 
-        self.tags = tags  # type: ignore
+        # `tags` groups the controller endpoints in Swagger API docs; a single `str` is normalised to `[str]`
+        if isinstance(tags, str):
+            tags = [tags] if tags else None
+        self.tags: Optional[List[str]] = tags
 
         self.auto_import: bool = auto_import  # set to false and it would be ignored when api.auto_discover is called
         # `controller_class` target class that the APIController wraps
         self._controller_class: Optional[Type["ControllerBase"]] = None
         # `_path_operations` a converted dict of APIController route function used by Django-Ninja library
-        self._path_operations: Dict[str, ControllerPathView] = dict()
-        self._controller_class_route_functions: Dict[str, RouteFunction] = dict()
+        self._path_operations: Dict[str, ControllerPathView] = {}
+        self._controller_class_route_functions: Dict[str, RouteFunction] = {}
+        # `_url_patterns_cache` URLPatterns built by `urls_paths`, keyed by prefix
+        self._url_patterns_cache: Dict[str, List[URLPattern]] = {}
         # `permission_classes` a collection of BasePermission Types
         # a fallback if route functions has no permissions definition
-        self.permission_classes: PermissionType = permissions or [AllowAny]  # type: ignore
+        self.permission_classes: PermissionType = permissions or _DEFAULT_PERMISSIONS
         # `registered` prevents controllers from being register twice or exist in two different `api` instances
         self.registered: bool = False
 
@@ -286,18 +369,6 @@ class APIController:
         assert self._controller_class, "Controller Class is not available"
         return self._controller_class
 
-    @property
-    def tags(self) -> Optional[List[str]]:
-        # `tags` is a property for grouping endpoint in Swagger API docs
-        return self._tags
-
-    @tags.setter
-    def tags(self, value: Union[str, List[str], None]) -> None:
-        tag: Optional[List[str]] = cast(Optional[List[str]], value)
-        if tag and isinstance(value, str):
-            tag = [value]
-        self._tags = tag
-
     def __call__(self, cls: Type) -> Type["ControllerBase"]:
         self.auto_import = getattr(cls, "auto_import", self.auto_import)
         if not issubclass(cls, ControllerBase):
@@ -307,20 +378,23 @@ class APIController:
             cls._api_controller = self
 
         if not self.tags:
-            tag = str(cls.__name__).lower().replace("controller", "")
-            self.tags = [tag]
+            self.tags = [cls.__name__.lower().replace("controller", "")]
 
         self._controller_class = cls
-        bases = inspect.getmro(cls)
-        for base_cls in reversed(bases):
-            if base_cls not in [ControllerBase, ABC, object]:
+        if len(cls.__mro__) <= 4:
+            # (cls, ControllerBase, ABC, object): only `cls` can define route functions
+            compute_api_route_function(cls, self)
+        else:
+            for base_cls in get_route_function_bases(cls):
                 compute_api_route_function(base_cls, self)
 
         for _, v in self._controller_class_route_functions.items():
             self._add_operation_from_route_function(v)
 
-        if not is_decorated_with_inject(cls.__init__):
-            fail_silently(inject, constructor_or_class=cls)
+        if not cls.__dict__.get("_ninja_inject_applied", False):
+            if not is_decorated_with_inject(cls.__init__):
+                fail_silently(inject, constructor_or_class=cls)
+            cls._ninja_inject_applied = True
 
         ControllerRegistry().add_controller(cls)
         return cls
@@ -346,17 +420,27 @@ class APIController:
         ] = route_function
 
     def urls_paths(self, prefix: str) -> Iterator[URLPattern]:
+        return iter(self.prebuilt_urls(prefix))
+
+    def prebuilt_urls(self, prefix: str) -> List[URLPattern]:
+        # materialized once per prefix so the api can include all controller urls at once
+        url_patterns = self._url_patterns_cache.get(prefix)
+        if url_patterns is None:
+            url_patterns = list(self._build_url_patterns(prefix))
+            self._url_patterns_cache[prefix] = url_patterns
+        return url_patterns
+
+    def _build_url_patterns(self, prefix: str) -> Iterator[URLPattern]:
         for path, path_view in self.path_operations.items():
-            path = path.replace("{", "<").replace("}", ">")
+            path = path.translate(_PATH_PARAMETER_BRACES_TRANS)
             route = "/".join([i for i in (prefix, path) if i])
             # to skip lot of checks we simply treat double slash as a mistake:
             route = normalize_path(route)
             route = route.lstrip("/")
+            view = path_view.get_view()
             for op in path_view.operations:
                 op = cast(Operation, op)
-                yield django_path(
-                    route, path_view.get_view(), name=cast(str, op.url_name)
-                )
+                yield django_path(route, view, name=cast(str, op.url_name))
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<controller - {self.controller_class.__name__}>"
@@ -366,7 +450,7 @@ class APIController:
 
     def _add_operation_from_route_function(self, route_function: RouteFunction) -> None:
         # converts route functions to Operation model
-        route_function.route.route_params.operation_id = f"{str(uuid.uuid4())[:8]}_controller_{route_function.route.view_func.__name__}"
+        route_function.route.route_params.operation_id = f"op{next(_op_id_counter):08x}_controller_{route_function.route.view_func.__name__}"
 
         if (
             self.auth
@@ -381,7 +465,9 @@ class APIController:
             )
 
         route_function.operation = self.add_api_operation(  # type: ignore
-            view_func=route_function.as_view, **route_function.route.route_params.dict()
+            view_func=route_function.as_view,
+            # field values are passed as-is; `.dict()` would recursively copy them
+            **route_function.route.route_params.__dict__,
         )
 
     def add_api_operation(
@@ -408,11 +494,10 @@ class APIController:
 
         if self._prefix_has_route_param:
             path = normalize_path("/".join([i for i in (self.prefix, path) if i]))
-        if path not in self._path_operations:
-            path_view = ControllerPathView()
-            self._path_operations[path] = path_view
-        else:
-            path_view = self._path_operations[path]
+        self._url_patterns_cache.clear()
+        path_view = self._path_operations.get(path)
+        if path_view is None:
+            path_view = self._path_operations[path] = ControllerPathView()
         operation = path_view.add_operation(
             path=path,
             methods=methods,
@@ -1,11 +1,14 @@
-from typing import Any, List, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from django.http.request import HttpRequest
 from ninja.types import DictStrAny
-from pydantic import BaseModel as PydanticModel, Field
+from pydantic import BaseModel as PydanticModel, Field, PrivateAttr
 
 from ninja_extra.types import PermissionType
 
+if TYPE_CHECKING:
+    from ninja_extra.permissions import BasePermission  # pragma: no cover
+
 
 class RouteContext(PydanticModel):
     """
@@ -19,3 +22,6 @@ class RouteContext(PydanticModel):
     request: Union[Any, HttpRequest, None] = None
     args: List[Any] = Field([])
     kwargs: DictStrAny = Field({})
+
+    # `_permission_instances` instantiated `permission_classes`, shared by all permission checks of the request
+    _permission_instances: Optional[Tuple["BasePermission", ...]] = PrivateAttr(None)
@@ -1,4 +1,4 @@
-from typing import List, Type, Union
+from typing import List, Tuple, Type, Union
 
 from ninja_extra.permissions.base import (
     BasePermission,
@@ -7,5 +7,8 @@ from ninja_extra.permissions.base import (
 )
 
 PermissionType = Union[
-    List[Type[BasePermission]], List[OperandHolder], List[SingleOperandHolder]
+    List[Type[BasePermission]],
+    List[OperandHolder],
+    List[SingleOperandHolder],
+    Tuple[Type[BasePermission], ...],
 ]
@@ -35,6 +35,25 @@ def test_api_instance():
                 assert op.api is api
 
 
+def test_api_urls_include_prebuilt_controller_urls():
+    @api_controller("/prebuilt")
+    class PrebuiltURLsController:
+        @http_get("/example")
+        def example(self):
+            pass
+
+    prebuilt_api = NinjaExtraAPI(urls_namespace="prebuilt_urls")
+    prebuilt_api.register_controllers(PrebuiltURLsController)
+
+    urls = prebuilt_api.urls[0]
+    assert "prebuilt/example" in [str(url.pattern) for url in urls]
+
+    api_controller_instance = PrebuiltURLsController.get_api_controller()
+    prebuilt_urls = api_controller_instance.prebuilt_urls("/prebuilt")
+    assert prebuilt_urls[0] in urls
+    assert api_controller_instance.prebuilt_urls("/prebuilt") is prebuilt_urls
+
+
 def test_api_auto_discover_controller():
     ninja_extra_api = NinjaExtraAPI()
     assert str(SomeAPIController) in ControllerRegistry.get_controllers()
@@ -3,12 +3,14 @@ from unittest.mock import Mock, patch
 import django
 import pytest
 from django.contrib.auth.models import Group
+from ninja.renderers import JSONRenderer
 
 from ninja_extra import NinjaExtraAPI, api_controller, exceptions, http_get, testing
 from ninja_extra.controllers import ControllerBase, RouteContext, RouteFunction
 from ninja_extra.controllers.base import (
     APIController,
     compute_api_route_function,
+    get_route_function_bases,
     get_route_functions,
 )
 from ninja_extra.controllers.response import Detail, Id, Ok
@@ -67,7 +69,7 @@ class TestAPIController:
         assert not api_controller_instance._prefix_has_route_param
         assert api_controller_instance.prefix == "prefix"
         assert api_controller_instance.tags == ["new_tag"]
-        assert api_controller_instance.permission_classes == [AllowAny]
+        assert api_controller_instance.permission_classes == (AllowAny,)
 
         api_controller_instance = api_controller()
         assert api_controller_instance.prefix == ""
@@ -99,7 +101,7 @@ class TestAPIController:
         _api_controller = SomeController.get_api_controller()
         assert _api_controller.tags == ["some"]
         assert _api_controller._path_operations == {}
-        assert _api_controller.permission_classes == [AllowAny]
+        assert _api_controller.permission_classes == (AllowAny,)
         assert SomeController.api is None
         assert _api_controller.registered is False
         assert ControllerBase in SomeController.__bases__
@@ -110,6 +112,32 @@ class TestAPIController:
     def test_controller_should_wrap_with_inject(self):
         assert not hasattr(SomeController.__init__, "__bindings__")
         assert hasattr(SomeControllerWithInject.__init__, "__bindings__")
+        assert SomeControllerWithInject.__dict__["_ninja_inject_applied"]
+
+    def test_controller_inject_sentinel_is_per_class(self):
+        @api_controller
+        class BaseInjectController(ControllerBase):
+            def __init__(self, a: str):
+                pass
+
+        with patch(
+            "ninja_extra.controllers.base.is_decorated_with_inject"
+        ) as mock_is_decorated_with_inject:
+            api_controller(BaseInjectController)
+            mock_is_decorated_with_inject.assert_not_called()
+
+            class ChildInjectController(BaseInjectController):
+                def __init__(self, b: int):
+                    pass
+
+            mock_is_decorated_with_inject.return_value = False
+            api_controller(ChildInjectController)
+            mock_is_decorated_with_inject.assert_called_once_with(
+                ChildInjectController.__init__
+            )
+
+        assert ChildInjectController.__dict__["_ninja_inject_applied"]
+        assert hasattr(ChildInjectController.__init__, "__bindings__")
 
     def test_controller_should_have_path_operation_list(self):
         _api_controller = SomeControllerWithRoute.get_api_controller()
@@ -124,9 +152,28 @@ class TestAPIController:
         assert operation.methods == route_function.route.route_params.methods
         assert operation.operation_id == route_function.route.route_params.operation_id
 
+    def test_controller_urls_paths_are_cached_per_prefix(self):
+        _api_controller = SomeControllerWithRoute.get_api_controller()
+        urls = list(_api_controller.urls_paths("prefix"))
+        assert len(urls) == 4
+        assert str(urls[1].pattern) == "prefix/example/<ex_id>"
+        assert list(_api_controller.urls_paths("prefix")) == urls
+        assert _api_controller._url_patterns_cache["prefix"] == urls
+
     def test_get_route_function_should_return_instance_route_definitions(self):
         for route_definition in get_route_functions(SomeControllerWithRoute):
             assert isinstance(route_definition, RouteFunction)
+        route_class = SomeControllerWithRoute.__bases__[1]
+        route_functions = get_route_functions(route_class)
+        assert len(route_functions) == 4
+        assert route_class.__dict__["__route_functions_cache__"] is route_functions
+        assert get_route_functions(route_class) is route_functions
+
+    def test_get_route_function_bases_skips_controller_base_internals(self):
+        bases = get_route_function_bases(SomeControllerWithRoute)
+        assert bases == (SomeControllerWithRoute.__bases__[1], SomeControllerWithRoute)
+        assert SomeControllerWithRoute.__dict__["__api_controller_bases__"] is bases
+        assert get_route_function_bases(SomeControllerWithRoute) is bases
 
     def test_compute_api_route_function_works(self):
         _api_controller = api_controller()
@@ -168,6 +215,19 @@ class TestAPIController:
                 controller_object.get_object_or_exception(Group, id=group_instance.id)
                 assert isinstance(ex, exceptions.PermissionDenied)
 
+    def test_controller_base_permissions_are_instantiated_once_per_context(self):
+        controller_object = SomeController()
+        assert controller_object._get_permissions() == ()
+
+        controller_object.context = RouteContext(
+            request=Mock(), permission_classes=[AllowAny]
+        )
+        permissions = controller_object._get_permissions()
+        assert len(permissions) == 1 and isinstance(permissions[0], AllowAny)
+        controller_object.check_permissions()
+        controller_object.check_object_permissions(Mock())
+        assert controller_object._get_permissions() is permissions
+
     @pytest.mark.django_db
     def test_controller_base_get_object_or_none_works(self):
         group_instance = Group.objects.create(name="_groupowner2")
@@ -263,3 +323,20 @@ class TestAPIControllerResponse:
         assert isinstance(result, tuple)
         assert result[1] == id_response.convert_to_schema()
         assert result[0] == id_response.status_code
+
+    def test_controller_create_response_content_type_follows_renderer(self):
+        class UnhashableRenderer(JSONRenderer):
+            def __eq__(self, other):
+                return isinstance(other, UnhashableRenderer)
+
+        renderer = UnhashableRenderer()
+        controller_object = SomeController()
+        controller_object.api = NinjaExtraAPI(renderer=renderer)
+        controller_object.context = RouteContext(request=Mock())
+
+        response = controller_object.create_response({"detail": "ok"})
+        assert response["Content-Type"] == "application/json; charset=utf-8"
+
+        renderer.charset = "latin-1"
+        response = controller_object.create_response({"detail": "ok"})
+        assert response["Content-Type"] == "application/json; charset=latin-1"